@@ -1,32 +1,41 @@
-
-from dotenv import load_dotenv, find_dotenv
-load_dotenv(find_dotenv())
-
-
+import os
 import sys
-import json
 import importlib
-from pathlib import Path
+from functools import lru_cache
 
 import click
 from loguru import logger
-from tomlkit.exceptions import ParseError
+from tomllib import TOMLDecodeError
 
+from watools.core import jsonutils
 from watools.core.config import config
 from watools.cli.logger import setup_logger
 from watools.core.paths import get_project_root
 
 COMMAND_FOLDER = get_project_root() / "watools" / "commands"
 
-class WatoolsCLI(click.MultiCommand):
+
+@lru_cache(maxsize=1)
+def _command_names() -> tuple[str, ...]:
+    # Command modules don't change within a process, so scan the folder once
+    with os.scandir(COMMAND_FOLDER) as entries:
+        return tuple(sorted(
+            entry.name[:-3]
+            for entry in entries
+            if entry.name.endswith(".py") and not entry.name.startswith("_") and entry.is_file()
+        ))
+
+
+class WatoolsCLI(click.Group):
+    """Group that imports each command module only when it is invoked."""
+
     def list_commands(self, ctx):
-        return sorted(
-            f.stem
-            for f in COMMAND_FOLDER.glob("*.py")
-            if f.name not in ("__init__.py",) and not f.name.startswith("_")
-        )
+        return list(_command_names())
 
     def get_command(self, ctx, name):
+        if name not in _command_names():
+            return None
+
         try:
             mod = importlib.import_module(f"watools.commands.{name}")
         except Exception as e:
@@ -49,11 +58,22 @@ class WatoolsCLI(click.MultiCommand):
     help="Override log level (also enables traceback for DEBUG or TRACE)",
 )
 @click.option('--account-id', default=None,type=int, help="Account ID to filter by")
+@click.option('--no-cache', is_flag=True, default=False, help="Ignore cached API responses and refetch them")
 @click.pass_context
-def cli(ctx, log_level, account_id ):
+def cli(ctx, log_level, account_id, no_cache ):
     """watools: CLI for managing Wild Apricot integrations."""
 
+    # Without a subcommand there is only help to show; skip config and credential loading
+    if ctx.invoked_subcommand is None:
+        click.echo(ctx.get_help())
+        return
+
     def perform_setup():
+        # Imported here so --help and completion never pay for dotenv
+        from dotenv import load_dotenv, find_dotenv
+
+        # .env may set WATOOLS_CONFIG_DIR / WATOOLS_CACHE_DIR, so load it before the config
+        load_dotenv(find_dotenv())
         config.load()
         if not log_level and config.log_level in [
             "TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL"
@@ -68,6 +88,7 @@ def cli(ctx, log_level, account_id ):
 
     ctx.ensure_object(dict)
     ctx.obj["debug_exceptions"] = debug_exceptions
+    ctx.obj["no_cache"] = no_cache
 
     if debug_exceptions:
         logger.warning("Debug exception mode enabled: exceptions will not be caught.")
@@ -78,7 +99,7 @@ def cli(ctx, log_level, account_id ):
         except FileNotFoundError as e:
             logger.error(f"Config file not found: {e}")
             ctx.exit(1)
-        except ParseError as e:
+        except TOMLDecodeError as e:
             logger.error(f"Failed to parse config TOML: {e}")
             ctx.exit(1)
         except (KeyError, ValueError, TypeError) as e:
@@ -107,8 +128,5 @@ def cli(ctx, log_level, account_id ):
             ctx.obj["account_id"] = str(account_id)
             logger.debug(f"Using account_id from CLI: {account_id}")
 
-        logger.debug(f"config._raw_config: \n{json.dumps(config._raw_config, indent=2)}")
-        logger.debug(f"ctx.obj\n{json.dumps(ctx.obj, indent=2)}")
-
-    if ctx.invoked_subcommand is None:
-        click.echo(ctx.get_help())
+        logger.opt(lazy=True).debug("config._raw_config: \n{}", lambda: jsonutils.dumps(config._raw_config))
+        logger.opt(lazy=True).debug("ctx.obj\n{}", lambda: jsonutils.dumps(ctx.obj))
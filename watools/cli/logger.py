@@ -1,29 +1,36 @@
+from functools import partial
+
 import click
 from loguru import logger
 
 
-def click_sink(message):
+_LEVEL_COLORS = {
+    "TRACE": "bright_black",
+    "DEBUG": "cyan",
+    "INFO": "white",
+    "SUCCESS": "green",
+    "WARNING": "yellow",
+    "ERROR": "red",
+    "CRITICAL": "bright_red",
+}
+
+# ANSI codes styled once here rather than through click.secho for every record
+_LEVEL_STYLES = {level: click.style("", fg=color, reset=False) for level, color in _LEVEL_COLORS.items()}
+_DEFAULT_STYLE = click.style("", fg="white", reset=False)
+_RESET = "\x1b[0m"
+
+
+def click_sink(message, log_source=False):
     record = message.record
     level = record["level"].name
-    color = {
-        "TRACE": "bright_black",
-        "DEBUG": "cyan",
-        "INFO": "white",
-        "SUCCESS": "green",
-        "WARNING": "yellow",
-        "ERROR": "red",
-        "CRITICAL": "bright_red",
-    }.get(level, "white")
+    text = record["message"].rstrip()
 
     # Add source file + line number prefix if enabled
-    prefix = ""
-    if record["extra"].get("log_source"):
-        module = record["module"]
-        function = record["function"]
-        line = record["line"]
-        prefix = f"{level} [{module}.{function}:{line}] "
+    if log_source:
+        text = f"{level} [{record['module']}.{record['function']}:{record['line']}] {text}"
 
-    click.secho(prefix + record["message"].rstrip(), fg=color)
+    # click.echo still strips the styling when output isn't a terminal
+    click.echo(f"{_LEVEL_STYLES.get(level, _DEFAULT_STYLE)}{text}{_RESET}")
 
 
 def setup_logger(level="INFO"):
@@ -42,10 +49,9 @@ def setup_logger(level="INFO"):
     logger.remove()
 
     logger.add(
-        click_sink,
+        partial(click_sink, log_source=log_source),
         level=level.upper(),
         format="{message}",
         backtrace=show_traceback,
         diagnose=show_traceback,
-        filter=lambda record: record.update(extra={"log_source": log_source}) or True
     )
@@ -1,21 +1,23 @@
 """
 """
-import json
 import click
 from loguru import logger
 
-from watools.core.api import get_account
+from watools.core import jsonutils
 from watools.core.utils import list_account
 
 @click.command()
 @click.pass_context
 @click.option('--as-json', is_flag=True, default=False, help="List all accounts info in JSON format")
-def cmd( ctx,as_json ):
+@click.option('--pretty/--no-pretty', default=False, help='Indent --as-json output (compact by default)')
+def cmd( ctx,as_json,pretty ):
     """ Display Wild Apricot account details in pretty JSON format."""
 
+    from watools.core.api import get_account  # deferred: pulls in the requests stack
+
     try:
-        account = get_account()
-        logger.trace(f"Accounts: {account}")
+        account = get_account(reload=ctx.obj.get("no_cache", False))
+        logger.trace("Accounts: {}", account)
         if not account:
             click.echo("No accounts found.")
             return
@@ -24,7 +26,7 @@ def cmd( ctx,as_json ):
         return
 
     if as_json:
-        click.echo(json.dumps(account, indent=2))
+        jsonutils.echo(account, indent=pretty)
     else:
         list_account(account,)
 
@@ -1,21 +1,23 @@
 """
 """
-import json
 import click
 from loguru import logger
 
-from watools.core.api import get_accounts
+from watools.core import jsonutils
 from watools.core.utils import list_accounts
 
 @click.command()
 @click.pass_context
 @click.option('--as-json', is_flag=True, default=False, help="List all accounts info in JSON format")
-def cmd( ctx,as_json ):
+@click.option('--pretty/--no-pretty', default=False, help='Indent --as-json output (compact by default)')
+def cmd( ctx,as_json,pretty ):
     """Display Wild Apricot account details in pretty JSON format."""
 
+    from watools.core.api import get_accounts  # deferred: pulls in the requests stack
+
     try:
-        accounts = get_accounts()
-        logger.trace(f"Accounts: {accounts}")
+        accounts = get_accounts(reload=ctx.obj.get("no_cache", False))
+        logger.trace("Accounts: {}", accounts)
         if not accounts:
             click.echo("No accounts found.")
             return
@@ -24,7 +26,7 @@ def cmd( ctx,as_json ):
         return
 
     if as_json:
-        click.echo(json.dumps(accounts, indent=2))
+        jsonutils.echo(accounts, indent=pretty)
     else:
         list_accounts(accounts)
 
@@ -1,10 +1,9 @@
 
 
-import json
 import click
 from loguru import logger
 
-from watools.core.api import get_contacts
+from watools.core import jsonutils
 from watools.core.utils import list_contacts, list_contact_details, summarize_contact_fields, summarize_membership_levels, \
     summarize_member_groups, summarize_levels_by_status, summarize_groups_by_status, member_legend, \
     default_contacts_csv_filename, write_contacts_to_csv
@@ -29,7 +28,7 @@ def cmd(ctx, contact_id, as_json, reload, to_csv):
     """Manage Wild Apricot contacts"""
 
     ctx.ensure_object(dict)
-    logger.debug(f"Invoked subcommand: {ctx.invoked_subcommand}" )
+    logger.debug("Invoked subcommand: {}", ctx.invoked_subcommand)
 
     account_id = ctx.obj.get('account_id')
     if not account_id:
@@ -38,15 +37,16 @@ def cmd(ctx, contact_id, as_json, reload, to_csv):
 
     if not contact_id:
         contact_id = ctx.obj.get('contact_id')
-        logger.debug(f"Contact ID from context: {contact_id}")
+        logger.debug("Contact ID from context: {}", contact_id)
     else:
         ctx.obj["contact_id"] = contact_id
-        logger.debug(f"Contact ID from CLI: {contact_id}")
+        logger.debug("Contact ID from CLI: {}", contact_id)
 
     if not ctx.invoked_subcommand:
+        from watools.core.api import get_contacts  # deferred: pulls in the requests stack
 
-        contacts = get_contacts( account_id, reload=reload )
-        logger.trace( json.dumps( contacts[:5] ) )
+        contacts = get_contacts( account_id, reload=reload or ctx.obj.get("no_cache", False) )
+        logger.opt(lazy=True).trace("{}", lambda: jsonutils.dumps(contacts[:5], indent=False))
 
         if contacts:
 
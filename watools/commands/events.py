@@ -1,19 +1,28 @@
 
 import click
-import json
 
-from datetime import datetime
 from loguru import logger
 
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from watools.core.api import get_events, get_event_details, get_event_registrants, \
-    get_default_membership_levels, get_default_membergroups, \
-    get_contacts, register_contacts_to_event
+from watools.core import jsonutils
+
+# watools.core.api (and the requests stack behind it) is imported inside the commands
+# so that --help and dispatch don't pay for it
 
 from watools.core.utils import filter_events, list_events, list_event_details
 
 
+def _resolve_ids(ctx, event_id=None):
+    """Return (account_id, event_id) from the CLI options, falling back to the context set by parent groups."""
+    ctx.ensure_object(dict)
+    account_id = ctx.obj.get("account_id")
+    if event_id is None:
+        event_id = ctx.obj.get("event_id")
+    return account_id, (str(event_id) if event_id else None)
+
+
 @click.group("events", invoke_without_command=True)
 @click.option('--event-id', type=int, help='Filter by specific event ID')
 @click.option('--all', 'show_all', is_flag=True, help='Show all events, bypass default date filter')
@@ -24,46 +33,55 @@ from watools.core.utils import filter_events, list_events, list_event_details
 @click.option('--before', type=click.DateTime(), help='Only events before this date')
 @click.option('--query', type=str, help='Ad hoc query expression (e.g., \'ConfirmedRegistrationsCount > 5 and "Diamond" in Name\')')
 @click.option('--as-json', is_flag=True, default=False, help='Output events as JSON')
+@click.option('--pretty/--no-pretty', default=False, help='Indent --as-json output (compact by default)')
 @click.pass_context
-def cmd(ctx, event_id, show_all,future, year, month, after, before, query, as_json):
+def cmd(ctx, event_id, show_all,future, year, month, after, before, query, as_json, pretty):
     """Manage Wild Apricot events."""
 
-    ctx.ensure_object(dict)
-    account_id = ctx.obj.get("account_id")
+    account_id, event_id = _resolve_ids(ctx, event_id)
     if not account_id:
         logger.error("No account ID provided. Use --account-id or configure it.")
         return
 
-    logger.debug(f"Fetching events for account {account_id}")
-    event_data = get_events(account_id)
-    events = event_data.get("Events", [])
+    # Subcommands fetch the event they need themselves, so skip the events listing
+    if ctx.invoked_subcommand:
+        if event_id:
+            ctx.obj["event_id"] = event_id
+        logger.debug("Leaving group commands to run subcommand: {}", ctx.invoked_subcommand)
+        return
 
-    # Filter by ID directly
-    if event_id:
+    from watools.core.api import ApiHttpError, get_events, get_event_details
 
-        events = [e for e in events if str(e.get("Id")) == str(event_id)]
+    # Show single event details, fetched directly rather than picked out of the full listing
+    if event_id:
 
-        if not events:
+        try:
+            event = get_event_details(event_id, account_id=account_id, reload=ctx.obj.get("no_cache", False))
+        except ApiHttpError as e:
+            # Only a 404 means the event doesn't exist; auth, server and config errors propagate
+            if e.status_code != 404:
+                raise
+            logger.debug(e)
             click.echo(f"No event found with ID: {event_id}")
             return
 
-        if ctx.invoked_subcommand:
-            ctx.obj["event_id"] = str(event_id)
-            logger.debug(f"Leaving group commands to run subcommand: {ctx.invoked_subcommand}")
-            return
-
-        # Show single event details
-        event = get_event_details(event_id, account_id=account_id)
         logger.debug( event )
         if event:
             if as_json:
-                click.echo(json.dumps(event, indent=2))
+                jsonutils.echo(event, indent=pretty)
             else:
                 list_event_details(event)
         else:
             click.echo(f"Failed to load details for event ID {event_id}")
         return
 
+    # A year filter can be pushed to the API; filter_events below still applies every filter
+    filter_expr = f"StartDate ge {year}-01-01 and StartDate lt {year + 1}-01-01" if year else None
+
+    logger.debug("Fetching events for account {}", account_id)
+    event_data = get_events(account_id, reload=ctx.obj.get("no_cache", False), filter_expr=filter_expr)
+    events = event_data.get("Events", [])
+
     # Apply filters
     events = filter_events(
         events,
@@ -81,7 +99,7 @@ def cmd(ctx, event_id, show_all,future, year, month, after, before, query, as_js
         return
 
     if as_json:
-        click.echo(json.dumps(events, indent=2))
+        jsonutils.echo(events, indent=pretty)
     else:
         click.echo("")  # spacing
         list_events(
@@ -111,6 +129,16 @@ def parse_statuses(ctx, param, values):
     return result
 
 
+def _contact_group_ids(contact):
+    """Return the member group IDs from a contact's 'Groups' field as a frozenset."""
+    return frozenset(
+        group.get("Id")
+        for field in contact.get("FieldValues", [])
+        if field.get("SystemCode") == "Groups"
+        for group in field.get("Value") or []
+    )
+
+
 @cmd.command()
 @click.option('--event-id', type=int, required=False, default=None, help='Event ID for auto-registration')
 @click.option(
@@ -125,37 +153,87 @@ def parse_statuses(ctx, param, values):
 def auto_register(ctx, event_id, use_status, confirm):
     """ Autoregister contacts to event """
 
-    account_id = ctx.obj.get('account_id')
+    # --event-id may be given to this command or to the events group
+    account_id, event_id = _resolve_ids(ctx, event_id)
     if not account_id:
         logger.error("No account ID provided. Use --account-id or add to config.toml.")
         return
 
-    event_id = ctx.obj.get('event_id')
     if not event_id:
         logger.error("No event_id provided. Use --event-id to specify an event.")
         return
 
+    from watools.core.api import get_access_token, get_event_details, get_event_registrants, \
+        get_default_membership_levels, get_default_membergroups, \
+        get_contacts, register_contacts_to_event
+
     try:
+        # Get the access token first so the workers below don't each request one.
+        get_access_token( account_id )
+
         # Fetch event details (dict), look for AccessControl
-        event = get_event_details( event_id, account_id=account_id )
+        event = get_event_details( event_id, account_id=account_id, reload=ctx.obj.get("no_cache", False) )
         if not event:
             logger.error(f"No event found with ID: {event_id}")
             return
         logger.info(f"---- Auto-registration for: {event["Name"]} ----")
 
+        # Check the event before fetching contacts, levels and groups for the whole account.
+
+        # Event Access control: by membership level and member group
+        # This determines who can see the event.  If you can see it, you can be auto-registered for it!
+        details = event.get("Details") or {}
+        access_control = details.get("AccessControl")
+        if not access_control:
+            logger.error(f"No access control found for event ID {event_id}.")
+            return 
+        
+        logger.opt(lazy=True).debug("Access control: {}", lambda: jsonutils.dumps(access_control, indent=False))
+
+        # Derive list of potential ticket types
+
+        registration_types = details.get("RegistrationTypes",{})
+        if not registration_types:
+            click.echo(f"No registration types found for event ID {event_id}.")
+            return
+        logger.opt(lazy=True).debug("Registration types: {}", lambda: jsonutils.dumps(registration_types, indent=False))
+
+        auto_register_types = [item for item in registration_types if "auto-register" in item["Name"].lower() ]
+        registration_type_ids = [item["Id"] for item in auto_register_types]
+        registration_type_names = [item["Name"] for item in auto_register_types]
+        logger.debug( f"Registration type IDs with 'auto-register' in name: { registration_type_ids }" )
+
+        if not registration_type_ids:
+            logger.error(f"No auto-register registration types found for event ID: {event_id}.")
+            logger.error(f"Review event and add one registration type with 'auto-register' in the name.")
+            return
+        
+        if len(registration_type_ids) > 1:
+            logger.error(f"Multiple auto-register registration types found for event ID: {event_id}.")
+            logger.error(f"Review event and delete extra auto-register events.")
+            return
+
+        # The remaining lookups are independent, so run them concurrently over the shared session.
+        reload = ctx.obj.get("no_cache", False)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            registrants_future = executor.submit( get_event_registrants, event_id, account_id=account_id )
+            contacts_future = executor.submit( get_contacts, account_id, reload=reload )
+            levels_future = executor.submit( get_default_membership_levels, account_id, reload=reload )
+            membergroups_future = executor.submit( get_default_membergroups, account_id, reload=reload )
+
         # Fetch registrants to current event (list of dict)
-        registrants = get_event_registrants( event_id, account_id=account_id )
+        registrants = registrants_future.result()
 
 
         # Fetch all contacts/members across entire account.
-        contacts = get_contacts( account_id )
+        contacts = contacts_future.result()
         if not contacts:
             click.echo(f"No contacts found for account ID {account_id}.")
             return
         logger.debug( f"Contacts: {len(contacts)}" )
 
         # Fetch default membership levels IDs.  These are for the entire account, not just event.
-        default_membership_levels = get_default_membership_levels( account_id )
+        default_membership_levels = levels_future.result()
         default_membership_levels = {item["Id"]: item for item in default_membership_levels}
         if not default_membership_levels:
             click.echo(f"No membership levels found for account ID {account_id}.")
@@ -165,7 +243,7 @@ def auto_register(ctx, event_id, use_status, confirm):
         logger.debug( f"Membership level ids: {default_membership_level_ids}" )
 
         # Fetch member groups ids.  These are for entire account, not just event.
-        default_membergroups = get_default_membergroups( account_id )
+        default_membergroups = membergroups_future.result()
         default_membergroups = {item["Id"]: item for item in default_membergroups}
         if not default_membergroups:
             click.echo(f"No member groups found for account ID {account_id}.")
@@ -174,93 +252,59 @@ def auto_register(ctx, event_id, use_status, confirm):
         default_membergroup_ids = default_membergroups.keys()
         logger.debug( f"Member group ids: {default_membergroup_ids}" )
 
-        # Event Access control: by membership level and member group
-        # This determines who can see the event.  If you can see it, you can be auto-registered for it!
-        access_control = event.get("Details",{}).get("AccessControl")
-        if not access_control:
-            logger.error(f"No access control found for event ID {event_id}.")
-            return 
-        
-        logger.debug(f"Access control: {json.dumps( access_control,indent=2)}")
-
         # Potential pools of registrants: Everyone unless restricted by access control.  Member level AND groups.
         membership_levels_ids = default_membership_level_ids
         if not access_control["AvailableForAnyLevel"]:
             membership_levels_ids = [item["Id"] for item in access_control.get("AvailableForLevels",[])]
-        logger.debug(f"Membership levels ids: {membership_levels_ids}")
+        logger.debug("Membership levels ids: {}", membership_levels_ids)
         for id in membership_levels_ids:
             logger.info(f"Autoregister level: {default_membership_levels.get(id,{}).get("Name")}")
 
         membergroup_ids = default_membergroup_ids
         if not access_control["AvailableForAnyGroup"]:
             membergroup_ids = [item["Id"] for item in access_control.get("AvailableForGroups",[])]
-        logger.debug(f"Member group ids: {membergroup_ids}")
+        logger.debug("Member group ids: {}", membergroup_ids)
         for id in membergroup_ids:
             logger.info(f"Autoregister group: {default_membergroups.get(id,{}).get("Name")} ({default_membergroups.get(id,{}).get("ContactsCount")})")
     
 
 
-        members_ids_by_level = [ contact["Id"] for contact in contacts if contact["MembershipLevelId"] in membership_levels_ids ]
-        logger.debug(f"Count of members ids by level: {len(members_ids_by_level)}")
-
         #logger.debug(f"{json.dumps([contact for contact in contacts if "Leonard" in contact["DisplayName"]],indent=2)}")
 
-        def contact_in_group(contact, group_ids):
-            for field in contact.get("FieldValues", []):
-                if field.get("SystemCode") == "Groups":
-                    for group in field.get("Value", []):
-                        if group.get("Id") in group_ids:
-                            return True
-            return False
-        
-        member_ids_by_group = [c["Id"] for c in contacts if contact_in_group(c, membergroup_ids)]
-        logger.debug(f"Count of member_ids_by_group: {len(member_ids_by_group)}")
+        level_id_set = frozenset(membership_levels_ids)
+        membergroup_id_set = frozenset(membergroup_ids)
+        current_registrant_ids = frozenset(c.get("Contact",{}).get("Id") for c in registrants)
 
-        current_registrant_ids = [c.get("Contact",{}).get("Id") for c in registrants]
+        # One pass over contacts: match by level or group, drop current registrants, and
+        # sort the remaining potential registrants by membership status (e.g., Active, etc.)
+        members_ids_by_level = []
+        member_ids_by_group = []
+        potential_registrant_ids = set()
+        status_groups = defaultdict(list)
+        for contact in contacts:
+            cid = contact["Id"]
+            in_level = contact["MembershipLevelId"] in level_id_set
+            in_group = not membergroup_id_set.isdisjoint(_contact_group_ids(contact))
+            if in_level:
+                members_ids_by_level.append(cid)
+            if in_group:
+                member_ids_by_group.append(cid)
+            if (in_level or in_group) and cid not in current_registrant_ids and cid not in potential_registrant_ids:
+                potential_registrant_ids.add(cid)
+                status_groups[contact.get("Status")].append(cid)
+
+        logger.debug("Count of members ids by level: {}", len(members_ids_by_level))
+        logger.debug("Count of member_ids_by_group: {}", len(member_ids_by_group))
 
-        # build list of potential registrants by combining level and group ids and removing current registrants
-        temp_ids = list(set(members_ids_by_level + member_ids_by_group))
-        potential_registrant_ids = [cid for cid in temp_ids if cid not in current_registrant_ids]
-        
         logger.info(f"---- Counts of current and potential registrants ----")
         logger.info(f"Count of current registrants: {len(current_registrant_ids)}")
         logger.info(f"Count of potential registrants: {len(potential_registrant_ids)}")
 
-        # Given list potential_registrant_ids, create sublists by membership status (e.g., Active, etc.)
-        status_groups = defaultdict(list)
-        for contact in contacts:
-            cid = contact.get("Id")
-            if cid in potential_registrant_ids:
-                status = contact.get("Status","Unknown")
-                status_groups[status].append(cid)
-
         logger.info("---- Breakdown of potential registrants ----")
         for key in status_groups.keys():
             logger.info(f"Count: {len(status_groups[key]):5} - {key}")         
         logger.info(f"Using status(s): {use_status}")  
 
-        # Derive list of potential ticket types
-
-        registration_types = event.get("Details",{}).get("RegistrationTypes",{})
-        if not registration_types:
-            click.echo(f"No registration types found for event ID {event_id}.")
-            return
-        logger.debug(f"Registration types: {json.dumps(registration_types,indent=2)}")
-
-        registration_type_ids = [item["Id"] for item in registration_types if "auto-register" in item["Name"].lower() ]
-        registration_type_names = [item["Name"] for item in registration_types if "auto-register" in item["Name"].lower() ]
-        logger.debug( f"Registration type IDs with 'auto-register' in name: { registration_type_ids }" )
-
-        if not registration_type_ids:
-            logger.error(f"No auto-register registration types found for event ID: {event_id}.")
-            logger.error(f"Review event and add one registration type with 'auto-register' in the name.")
-            return
-        
-        if len(registration_type_ids) > 1:
-            logger.error(f"Multiple auto-register registration types found for event ID: {event_id}.")
-            logger.error(f"Review event and delete extra auto-register events.")
-            return
-
         logger.info(f"Assigning registrants to: {registration_type_names[0]}")
 
         #logger.debug(f"Contact: {json.dumps([contact for contact in contacts if contact['DisplayName'] in ["Leonard, John"]], indent=2)}")
@@ -281,25 +325,12 @@ def auto_register(ctx, event_id, use_status, confirm):
                         click.echo(f"[{key}] registrations: {len(result["success"])} successful.")
                         click.echo(f"[{key}] registrations: {len(result["failed"])} failed.")
                     else:
-                        logger.debug(f"Key {key} has no records to process.")
+                        logger.debug("Key {} has no records to process.", key)
             else:
                 click.echo("No records to process.")
         else:
             logger.info("No action taken.  use --confirm to process")
-        return
-        event_details = get_event_details( account_id, event_id )
-        access_control = event_details.get("Details",{}).get("AccessControl",{})
-        logger.debug( json.dumps(access_control,indent=2) )
-
 
-        if as_json:
-            click.echo(json.dumps(registrants, indent=2))
-        else:
-            for reg in registrants:
-                name = reg.get("DisplayName", "Unknown")
-                click.echo(f"Name: {name}")
-
-    
     except Exception as e:
         #logger.error(f"Error fetching registrants: {e}")
         click.echo(f"Error: {e}")
@@ -1,23 +1,22 @@
 
 import click
-import json
 
-from datetime import datetime
 from loguru import logger
 
-from watools.core.api import get_default_membergroups
+from watools.core import jsonutils
 from watools.core.utils import list_groups, list_group_details
 
 
 @click.group('member-groups',invoke_without_command=True)
 @click.option('--member-group-id', type=int, help='Filter by specific group ID')
 @click.option('--as-json', is_flag=True, default=False, help='List all events info in JSON format')
+@click.option('--pretty/--no-pretty', default=False, help='Indent --as-json output (compact by default)')
 @click.pass_context
-def cmd(ctx, member_group_id, as_json):
+def cmd(ctx, member_group_id, as_json, pretty):
     """Manage Wild Apricot groups."""
 
     ctx.ensure_object(dict)
-    logger.debug(f"Invoked subcommand: {ctx.invoked_subcommand}" )
+    logger.debug("Invoked subcommand: {}", ctx.invoked_subcommand)
 
     account_id = ctx.obj.get('account_id')
     if not account_id:
@@ -25,29 +24,32 @@ def cmd(ctx, member_group_id, as_json):
         return
 
     if not member_group_id:
-        group_id = ctx.obj.get('membeg_group_id')
-        logger.debug(f"Group ID from context: {member_group_id}")
+        member_group_id = ctx.obj.get('member_group_id')
+        logger.debug("Group ID from context: {}", member_group_id)
     else:
         ctx.obj["member_group_id"] = member_group_id
-        logger.debug(f"Member group ID from CLI: {member_group_id}")
+        logger.debug("Member group ID from CLI: {}", member_group_id)
 
     if not ctx.invoked_subcommand:
-        groups = get_default_membergroups( account_id )
+        from watools.core.api import get_default_membergroups  # deferred: pulls in the requests stack
+
+        groups = get_default_membergroups( account_id, reload=ctx.obj.get("no_cache", False) )
         if groups:
 
             groups = {"MemberGroups":groups}
 
-            logger.trace( json.dumps( groups, indent=2) )
+            logger.opt(lazy=True).trace("{}", lambda: jsonutils.dumps(groups))
             
             if member_group_id:
-                groups = [group for group in groups.get("MemberGroups",[]) if str(group.get("Id")) == str(member_group_id)]
-                if not groups:
-                    click.echo(f"No event found with ID: {member_group_id}")
+                groups_by_id = {group.get("Id"): group for group in groups.get("MemberGroups",[])}
+                group = groups_by_id.get(member_group_id)
+                if not group:
+                    click.echo(f"No member group found with ID: {member_group_id}")
                     return
-                groups = {"MemberGroups": groups}
+                groups = {"MemberGroups": [group]}
 
             if as_json:
-                click.echo(json.dumps(groups, indent=2))
+                jsonutils.echo(groups, indent=pretty)
             else:
                 if member_group_id:
                     list_group_details( groups )
@@ -1,21 +1,67 @@
 # api.py
 
 import os
+import gzip
 import time
-import json
+import hashlib
+import tempfile
+import threading
 import requests
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from loguru import logger
 
+from watools.core import jsonutils
 from watools.core.config import config
-from watools.core.paths import get_default_cache_dir
+from watools.core.utils import parse_iso_datetime
+
+class ApiHttpError(RuntimeError):
+    """A Wild Apricot API call answered with an HTTP error status."""
+
+    def __init__(self, message, status_code):
+        super().__init__(message)
+        self.status_code = status_code
+
+    @property
+    def retryable(self):
+        # Rate limiting and server errors may pass on retry; other 4xx won't
+        return self.status_code == 429 or self.status_code >= 500
+
 
 # In-memory token cache keyed by account_id
 _token_cache = {}
 
+# Shared HTTP session so connections to the OAuth and API hosts are kept alive
+_session = None
+
+# (connect, read) seconds; requests.Session has no default, so every call passes it
+REQUEST_TIMEOUT = (10, 60)
+
+def get_session() -> requests.Session:
+    """
+    Return the shared requests.Session used for all Wild Apricot calls.
+
+    Idempotent requests are retried with backoff on connection errors,
+    rate limiting (429) and 5xx responses; POSTs are not retried here.
+    """
+    global _session
+    if _session is None:
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False,
+        )
+        _session = requests.Session()
+        _session.headers.update({"Accept": "application/json"})
+        _session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry))
+    return _session
+
 def get_access_token(account_id=None):
     if account_id is None:
         account_id = config.account_id
@@ -34,32 +80,122 @@ def get_access_token(account_id=None):
     if not client_id or not client_secret:
         raise ValueError(f"Missing client credentials for account_id: '{account_id}'.")
 
-    data = {"grant_type": "client_credentials", "scope": "auto"}
-    response = requests.post(
+    # Reuse a token saved by an earlier CLI run before asking for a new one
+    scope = "auto"
+    token_key = _token_cache_key(client_id, client_secret, scope)
+    token_info = _load_cached_token(token_key)
+    if token_info:
+        _token_cache[account_id] = token_info
+        return token_info["access_token"]
+
+    data = {"grant_type": "client_credentials", "scope": scope}
+    response = get_session().post(
         oauth_url,
         data=data,
         auth=HTTPBasicAuth(client_id, client_secret),
-        headers={"Content-Type": "application/x-www-form-urlencoded"}
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        timeout=REQUEST_TIMEOUT,
     )
 
     if response.status_code == 200:
-        token_data = response.json()
+        token_data = jsonutils.loads(response.content)
         access_token = token_data["access_token"]
         expiry = time.time() + token_data.get("expires_in", 1800) - 60
         _token_cache[account_id] = {"access_token": access_token, "expiry": expiry}
+        _save_cached_token(token_key, _token_cache[account_id])
         return access_token
     else:
         raise RuntimeError(f"OAuth token request failed: {response.status_code} {response.text}")
 
 
+def _token_cache_key(client_id, client_secret, scope):
+    # Hash of the full credentials: accounts sharing them share a token, a rotated
+    # secret or new scope misses the old file, and no credential is written to disk
+    return hashlib.sha256(f"{client_id}|{client_secret}|{scope}".encode("utf-8")).hexdigest()[:16]
+
+def _token_cache_file(token_key):
+    return config.get_cache_dir() / f"token-{token_key}.json"
+
+def _load_cached_token(token_key):
+    try:
+        token_info = jsonutils.loads(_token_cache_file(token_key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(token_info, dict):
+        return None
+    if time.time() < token_info.get("expiry", 0):
+        logger.debug("Loaded access token from cache.")
+        return token_info
+    return None
+
+def _write_cache_file(cache_file, data: bytes):
+    """
+    Write a cache file atomically: mkstemp creates the temp file owner-only (0600),
+    and os.replace swaps it in so readers never see a partial file.
+    """
+    tmp_path = None
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=cache_file.parent, prefix=f".{cache_file.stem}-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        if tmp_path:
+            Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+def _save_cached_token(token_key, token_info):
+    # Bearer tokens are credentials, so they rely on the owner-only cache file
+    try:
+        _write_cache_file(_token_cache_file(token_key), jsonutils.dumpb(token_info, indent=False))
+    except OSError as e:
+        logger.warning(f"Could not save access token to cache: {e}")
+
+
+def _response_cache_file(url):
+    key = hashlib.blake2b(url.encode("utf-8"), digest_size=16).hexdigest()
+    return config.get_cache_dir() / "responses" / f"{key}.json.gz"
+
+# Response headers kept with a cached body, and the request header that revalidates each one
+_VALIDATORS = {"ETag": "If-None-Match", "Last-Modified": "If-Modified-Since"}
+
+def _load_cached_response(url):
+    """Return (data, validators, age_seconds) for a cached GET, or None if there is no usable entry."""
+    cache_file = _response_cache_file(url)
+    try:
+        age = time.time() - cache_file.stat().st_mtime
+        with gzip.open(cache_file, "rb") as f:
+            entry = jsonutils.loads(f.read())
+    except (OSError, EOFError, gzip.BadGzipFile, ValueError):
+        # Missing, truncated or corrupt entries are treated as a cache miss
+        return None
+    if not isinstance(entry, dict) or "data" not in entry:
+        return None
+    return entry["data"], entry.get("validators") or {}, age
+
+def _save_cached_response(url, data, validators=None):
+    cache_file = _response_cache_file(url)
+    # The GET already succeeded, so a cache that can't be written only costs a refetch later
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        entry = jsonutils.dumpb({"validators": validators or {}, "data": data}, indent=False)
+        _write_cache_file(cache_file, gzip.compress(entry, compresslevel=1))
+    except OSError as e:
+        logger.warning(f"Could not save response for {url} to cache: {e}")
+
+def _touch_cached_response(url):
+    # A 304 confirms the cached body, so restart its freshness window
+    try:
+        os.utime(_response_cache_file(url))
+    except OSError:
+        pass
+
+
 def normalize_and_flatten_contacts(contacts):
-    all_keys = set()
+    # One pass: contacts keep only their own keys, so readers use .get() for optional fields
     flattened = []
     for contact in contacts:
-        all_keys.update(contact.keys())
-
-    for contact in contacts:
-        flat = {k: contact.get(k, None) for k in all_keys}
+        flat = dict(contact)
         ml = contact.get("MembershipLevel")
         flat["MembershipLevelId"] = ml.get("Id") if isinstance(ml, dict) else None
         flat["MembershipLevelName"] = ml.get("Name") if isinstance(ml, dict) else None
@@ -69,37 +205,71 @@ def normalize_and_flatten_contacts(contacts):
     return flattened
 
 
-def get_headers(account_id=None):
+@lru_cache(maxsize=8)
+def _headers_for(access_token):
+    # Shared between requests for the same token; callers must not mutate it
     return {
-        "Authorization": f"Bearer {get_access_token(str(account_id))}",
+        "Authorization": f"Bearer {access_token}",
         "Accept": "application/json",
         "Content-Type": "application/json"
     }
 
-def api_get(endpoint, account_id=None):
+def get_headers(account_id=None):
+    return _headers_for(get_access_token(str(account_id)))
+
+def api_get(endpoint, account_id=None, cache_ttl=None, reload=False, headers=None):
+    """
+    GET an API endpoint and return the parsed JSON.
+
+    When cache_ttl (seconds) is given, a response saved to the cache folder
+    within that window is returned without contacting the API. Use it only
+    for read-only endpoints whose data changes slowly. Older cached responses
+    that carry an ETag or Last-Modified are revalidated with If-None-Match /
+    If-Modified-Since and reused on a 304, so cache_ttl=0 always asks the
+    API but skips unchanged downloads.
+    reload=True ignores the cache and refreshes it from the API.
+    headers lets batch callers pass get_headers() computed once for the batch.
+    """
     url = config.api_base_url + endpoint
-    headers = get_headers(account_id)
-    response = requests.get(url, headers=headers)
+    cached = None
+    if cache_ttl is not None and not reload:
+        cached = _load_cached_response(url)
+        if cached is not None and cached[2] < cache_ttl:
+            logger.debug(f"Loaded GET {url} from cache.")
+            return cached[0]
+
+    headers = headers or get_headers(account_id)
+    if cached is not None and cached[1]:
+        headers = {**headers, **{_VALIDATORS[k]: v for k, v in cached[1].items() if k in _VALIDATORS}}
+    response = get_session().get(url, headers=headers, timeout=REQUEST_TIMEOUT)
     logger.debug(f"GET {url}")
+    if response.status_code == 304 and cached is not None:
+        logger.debug(f"GET {url} not modified; using cached response.")
+        _touch_cached_response(url)
+        return cached[0]
     if response.ok:
-        return response.json()
+        data = jsonutils.loads(response.content)
+        validators = {k: response.headers[k] for k in _VALIDATORS if k in response.headers}
+        if cache_ttl is not None and (cache_ttl > 0 or validators):
+            _save_cached_response(url, data, validators)
+        return data
     else:
-        raise RuntimeError(f"GET {url} failed: {response.status_code} {response.text}")
+        raise ApiHttpError(f"GET {url} failed: {response.status_code} {response.text}", response.status_code)
 
-def api_post(endpoint, payload, account_id=None):
+def api_post(endpoint, payload, account_id=None, headers=None):
     url = config.api_base_url + endpoint
-    headers = get_headers(account_id)
-    response = requests.post(url, headers=headers, json=payload)
+    headers = headers or get_headers(account_id)
+    response = get_session().post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT)
     logger.debug(f"POST {url} with payload: {payload}")
     if response.ok:
-        return response.json()
+        return jsonutils.loads(response.content)
     else:
-        raise RuntimeError(f"POST {url} failed: {response.status_code} {response.text}")
+        raise ApiHttpError(f"POST {url} failed: {response.status_code} {response.text}", response.status_code)
 
-def get_account(account_id=None):
+def get_account(account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    response = api_get(f"accounts/{account_id}", account_id)
+    response = api_get(f"accounts/{account_id}", account_id, cache_ttl=300, reload=reload)
     contact_limit_info = response.get("ContactLimitInfo")
     # Centralize adding WATOOLS specific key-value pairs
     if contact_limit_info:
@@ -108,16 +278,16 @@ def get_account(account_id=None):
         response["wat_contact_limit_info"] = f"(missing)"
     return response
 
-def get_accounts() -> list:
+def get_accounts(reload=False) -> list:
     account_ids = config.account_ids
-    accounts = []
-    if account_ids:
-        for account_id in account_ids:
-            accounts.append( get_account( account_id )  )
-    return accounts
+    if not account_ids:
+        return []
+    # Each account is an independent GET; fetch them concurrently over the shared session
+    with ThreadPoolExecutor(max_workers=min(8, len(account_ids))) as executor:
+        return list(executor.map(lambda account_id: get_account(account_id, reload=reload), account_ids))
 
 def add_new_event_fields( event ):
-    dt = datetime.fromisoformat(event["StartDate"])
+    dt = parse_iso_datetime(event["StartDate"])
     # Add formatted keys
     event["wat_start_day"] = dt.strftime("%a")             # e.g., "Tue"
     event["wat_start_date"] = dt.strftime("%Y-%b-%d")      # e.g., "2025-Jun-24"
@@ -126,7 +296,7 @@ def add_new_event_fields( event ):
     else:
         event["wat_start_time"] = ""
 
-    dt = datetime.fromisoformat(event["EndDate"])
+    dt = parse_iso_datetime(event["EndDate"])
     # Add formatted keys
     event["wat_end_day"] = dt.strftime("%a")             # e.g., "Tue"
     event["wat_end_date"] = dt.strftime("%Y-%b-%d")      # e.g., "2025-Jun-24"
@@ -142,129 +312,72 @@ def add_new_event_fields( event ):
     return event
 
 
-def get_events(account_id=None):
+def get_events(account_id=None, reload=False, filter_expr=None):
     if account_id is None:
         account_id = config.account_id
-    response = api_get(f"accounts/{account_id}/events", account_id)
+    endpoint = f"accounts/{account_id}/events"
+    if filter_expr:
+        # Let the API drop events we would discard anyway (e.g., "StartDate ge 2025-01-01")
+        endpoint += f"?$filter={filter_expr}"
+    response = api_get(endpoint, account_id, cache_ttl=0, reload=reload)
     for event in response.get("Events"):
-
         add_new_event_fields( event )
-        if 0:
-            dt = datetime.fromisoformat(event["StartDate"])
-            # Add formatted keys
-            event["wat_start_day"] = dt.strftime("%a")             # e.g., "Tue"
-            event["wat_start_date"] = dt.strftime("%Y-%b-%d")      # e.g., "2025-Jun-24"
-            if event.get("StartTimeSpecified"):
-                event["wat_start_time"] = dt.strftime("%I:%M%p").lstrip("0").lower()
-            else:
-                event["wat_start_time"] = ""
-
-            dt = datetime.fromisoformat(event["EndDate"])
-            # Add formatted keys
-            event["wat_end_day"] = dt.strftime("%a")             # e.g., "Tue"
-            event["wat_end_date"] = dt.strftime("%Y-%b-%d")      # e.g., "2025-Jun-24"
-            if event.get("EndTimeSpecified"):
-                event["wat_end_time"] = dt.strftime("%I:%M%p").lstrip("0").lower()
-            else:
-                event["wat_end_time"] = ""
-
-            confirmed = event.get("ConfirmedRegistrationsCount","-")
-            limit = str(event.get("RegistrationsLimit","*"))
-            limit = "*" if limit=="None" else limit
-            event["wat_confirmed_and_limit"] = f"{confirmed}/{limit}"
-        
     return response
 
-def get_event_details(event_id, account_id=None):
+def get_event_details(event_id, account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    response = api_get(f"accounts/{account_id}/events/{event_id}?$expand=AccessControl", account_id)
+    response = api_get(f"accounts/{account_id}/events/{event_id}?$expand=AccessControl", account_id, cache_ttl=0, reload=reload)
     add_new_event_fields( response )
     return response
 
-def get_default_membership_levels(account_id=None):
+def get_default_membership_levels(account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    levels = api_get(f"accounts/{account_id}/membershiplevels", account_id)
+    # Levels and groups change on human timescales, so they share the contacts cache expiry
+    levels = api_get(f"accounts/{account_id}/membershiplevels", account_id, cache_ttl=config.cache_expiry_seconds, reload=reload)
     return levels
 
 
-def get_default_membership_level_ids(account_id=None):
+def get_default_membership_level_ids(account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    levels = api_get(f"accounts/{account_id}/membershiplevels", account_id)
+    levels = get_default_membership_levels( account_id, reload=reload )
     return [level["Id"] for level in levels]
 
-def get_default_membergroups(account_id=None):
+def get_default_membergroups(account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    return api_get(f"accounts/{account_id}/membergroups", account_id)
+    return api_get(f"accounts/{account_id}/membergroups", account_id, cache_ttl=config.cache_expiry_seconds, reload=reload)
 
-def get_default_membergroup_ids(account_id=None):
+def get_default_membergroup_ids(account_id=None, reload=False):
     if account_id is None:
         account_id = config.account_id
-    groups = get_default_membergroups( account_id )
+    groups = get_default_membergroups( account_id, reload=reload )
     return [group["Id"] for group in groups]
 
-def get_contacts_xxx(account_id=None, exclude_archived=True, max_wait=10, normalize_contacts=True, use_cache=True, reload=False):
-    if account_id is None:
-        account_id = config.account_id
-
-    cache_file = get_default_cache_dir() / f"contacts-{account_id}.json"
-    logger.debug(f"cache file: {cache_file}")
-
-    if not reload:
-        if use_cache and cache_file.exists():
-            age = time.time() - cache_file.stat().st_mtime
-            if age < config.cache_expiry_seconds:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    logger.debug("Loaded contacts from cache.")
-                    contacts = json.load(f)
-                    return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
-
-    query_parts = []
-    if exclude_archived:
-        query_parts.append("$filter=IsArchived eq false")
-        query_parts.append("$select=*")
-
-    endpoint = f"accounts/{account_id}/contacts"
-    if query_parts:
-        endpoint += "?" + "&".join(query_parts)
-
-    response = api_get(endpoint, account_id)
-    logger.debug( json.dumps(response,indent=2) )
-
-
-    if "ResultUrl" in response:
-        result_url = response["ResultUrl"].replace(config.api_base_url, "")
-        state = response.get("State")
-        attempts = 0
-        while state != "Complete" and attempts < max_wait:
-            time.sleep(1.5)
-            response = api_get(result_url, account_id)
-            state = response.get("State")
-            attempts += 1
-        contacts = response.get("Contacts", [])
-    else:
-        contacts = response.get("Contacts", [])
-
-    if use_cache and contacts:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(contacts, f)
-            logger.debug("Contacts saved to cache.")
-
-    return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
 
+def _retry_after_seconds(response):
+    """Seconds from a numeric Retry-After header, or None if absent or given as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
 
-def api_get_result_url(initial_url: str, account_id: int = None, max_wait: int = 10, sleep_seconds: float = 1.5) -> dict:
+def api_get_result_url(initial_url: str, account_id: int = None, max_wait: int = 15, sleep_seconds: float = 0.2,
+                       max_sleep_seconds: float = 10.0, backoff: float = 1.6) -> dict:
     """
     Perform a Wild Apricot API GET request that may return a ResultUrl and require polling.
 
     Parameters:
         initial_url (str): The full API endpoint (relative, like 'accounts/12345/contacts?...')
         account_id (int): Optional account ID
-        max_wait (int): Maximum polling attempts (sleep_seconds * max_wait = total wait time)
-        sleep_seconds (float): Delay between polling attempts
+        max_wait (int): Maximum polling attempts
+        sleep_seconds (float): Delay before the first poll, kept short so small reports return quickly
+        max_sleep_seconds (float): Upper bound on the delay between polling attempts
+        backoff (float): Factor applied to the delay after each attempt; a Retry-After header overrides it,
+                         up to max_sleep_seconds
 
     Returns:
         dict: Final parsed JSON response after async processing (includes 'Contacts' or 'EventRegistrations')
@@ -274,114 +387,70 @@ def api_get_result_url(initial_url: str, account_id: int = None, max_wait: int =
     headers = get_headers(account_id)
 
     logger.debug(f"Initial request to {full_url}")
-    response = requests.get(full_url, headers=headers)
+    response = get_session().get(full_url, headers=headers, timeout=REQUEST_TIMEOUT)
     logger.debug(f"Response status: {response.status_code}")
 
     if not response.ok:
-        raise RuntimeError(f"GET {full_url} failed: {response.status_code} {response.text}")
+        raise ApiHttpError(f"GET {full_url} failed: {response.status_code} {response.text}", response.status_code)
 
-    data = response.json()
-    logger.debug(json.dumps(data, indent=2))
+    data = jsonutils.loads(response.content)
+    logger.opt(lazy=True).debug("{}", lambda: jsonutils.dumps(data, indent=False))
 
     # If asynchronous result is returned
     result_url = data.get("ResultUrl")
     if result_url:
-        logger.debug("ResultUrl detected. Sleeping before polling...")
-        time.sleep(sleep_seconds)
+        logger.debug("ResultUrl detected. Polling with exponential backoff...")
 
         state = data.get("State", "")
         attempts = 0
+        delay = sleep_seconds
         while state != "Complete" and attempts < max_wait:
+            time.sleep(delay)
+
             logger.debug(f"Polling attempt {attempts + 1}: {result_url}")
-            poll_response = requests.get(result_url, headers=headers)
-            data = poll_response.json()
-            logger.debug(json.dumps(data, indent=2))
+            poll_response = get_session().get(result_url, headers=headers, timeout=REQUEST_TIMEOUT)
+            retry_after = _retry_after_seconds(poll_response)
+            # A server-suggested Retry-After is honored but still capped like the backoff
+            delay = min(retry_after if retry_after is not None else delay * backoff, max_sleep_seconds)
+            data = jsonutils.loads(poll_response.content)
+            logger.opt(lazy=True).debug("{}", lambda: jsonutils.dumps(data, indent=False))
 
             state = data.get("State", "")
             attempts += 1
-            if state != "Complete":
-                time.sleep(sleep_seconds)
 
         if state != "Complete":
             raise TimeoutError(f"Polling timed out after {max_wait} attempts: {result_url}")
 
     return data
 
-def get_contactsxx(account_id=None, exclude_archived=True, max_wait=10, normalize_contacts=True, use_cache=True, reload=False):
-    if account_id is None:
-        account_id = config.account_id
-
-    cache_file = get_default_cache_dir() / f"contacts-{account_id}.json"
-    logger.debug(f"cache file: {cache_file}")
-
-    if not reload:
-        if use_cache and cache_file.exists():
-            age = time.time() - cache_file.stat().st_mtime
-            if age < config.cache_expiry_seconds:
-                with open(cache_file, "r", encoding="utf-8") as f:
-                    logger.debug("Loaded contacts from cache.")
-                    contacts = json.load(f)
-                    return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
-
-    # Build query
-    query_parts = []
-    if exclude_archived:
-        query_parts.append("$filter=IsArchived eq false")
-        query_parts.append("$select=*")
-
-    query_parts.append("$orderby=Id")
-
-    endpoint = f"accounts/{account_id}/contacts"
-    if query_parts:
-        endpoint += "?" + "&".join(query_parts)
-
-    response = api_get(endpoint, account_id)
-    logger.debug("Initial ResultUrl received. Sleeping 1.5 seconds before polling.")
-    time.sleep(1.5)
-
-    # If async ResultUrl is provided
-    if "ResultUrl" in response:
-        result_url = response["ResultUrl"]
-        state = response.get("State")
-        attempts = 0
-        while state != "Complete" and attempts < max_wait:
-            logger.debug(f"Waiting for results... attempt {attempts+1}")
-            time.sleep(1.5)
-            check_response = requests.get(result_url, headers=get_headers(account_id))
-            state = check_response.json().get("State")
-            response = check_response.json()
-            attempts += 1
-
-        contacts = response.get("Contacts", [])
-    else:
-        contacts = response.get("Contacts", [])
-
-    if use_cache and contacts:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(contacts, f)
-            logger.debug("Contacts saved to cache.")
 
-    return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
-
-def get_contacts(account_id=None, exclude_archived=True, max_wait=10, normalize_contacts=True, use_cache=True, reload=False):
+def get_contacts(account_id=None, exclude_archived=True, max_wait=15, normalize_contacts=True, use_cache=True, reload=False):
     if account_id is None:
         account_id = config.account_id
 
-    # Build cache path
-    cache_file = get_default_cache_dir() / f"contacts-{account_id}.json"
+    # Build cache path (config memoizes the cache dir, so no env/dir probing per call)
+    cache_file = config.get_cache_dir() / f"contacts-{account_id}.json.gz"
     logger.debug(f"cache file: {cache_file}")
 
-    # Load from cache if allowed
-    if not reload and use_cache and cache_file.exists():
-        age = time.time() - cache_file.stat().st_mtime
-        if age < config.cache_expiry_seconds:
-            with open(cache_file, "r", encoding="utf-8") as f:
+    # Load from cache if allowed; one stat both checks the file exists and gives its age
+    if not reload and use_cache:
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+        except OSError:
+            # Missing or inaccessible: fall through to a refetch, like an unreadable file below
+            age = None
+        if age is not None and age < config.cache_expiry_seconds:
+            try:
+                contacts = jsonutils.loads(gzip.decompress(cache_file.read_bytes()))
+            except (OSError, EOFError, ValueError) as e:
+                # Deleted since the stat, truncated or corrupt: refetch below and rewrite it
+                logger.warning(f"Ignoring unreadable contacts cache {cache_file}: {e}")
+            else:
                 logger.debug("Loaded contacts from cache.")
-                contacts = json.load(f)
                 return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
 
     # Build query
-    query_parts = []
+    query_parts = ["$async=true"]  # one background report + ResultUrl instead of paged requests
     if exclude_archived:
         query_parts.append("$filter=IsArchived eq false")
     query_parts.append("$select=*")
@@ -394,9 +463,12 @@ def get_contacts(account_id=None, exclude_archived=True, max_wait=10, normalize_
 
     contacts = response.get("Contacts", [])
     if use_cache and contacts:
-        with open(cache_file, "w", encoding="utf-8") as f:
-            json.dump(contacts, f)
+        # Contact exports compress well; level 1 keeps the write cheap
+        try:
+            _write_cache_file(cache_file, gzip.compress(jsonutils.dumpb(contacts, indent=False), compresslevel=1))
             logger.debug("Contacts saved to cache.")
+        except OSError as e:
+            logger.warning(f"Could not save contacts to cache: {e}")
 
     return normalize_and_flatten_contacts(contacts) if normalize_contacts else contacts
 
@@ -408,7 +480,7 @@ def get_event_registrants(event_id, account_id=None):
     endpoint = f"eventregistrations?eventId={event_id}"
     return api_get(endpoint, account_id)
 
-def register_contact_to_event(contact_id, event_id, reg_type_id, account_id=None):
+def register_contact_to_event(contact_id, event_id, reg_type_id, account_id=None, headers=None):
     if account_id is None:
         account_id = config.account_id
 
@@ -419,10 +491,58 @@ def register_contact_to_event(contact_id, event_id, reg_type_id, account_id=None
         "IsCheckedIn": False,
         "Status": "Confirmed"
     }
-    logger.trace(f"Payload for registration: {json.dumps(payload, indent=2)}")
-    return api_post("eventregistrations", payload, account_id)
+    logger.opt(lazy=True).trace("Payload for registration: {}", lambda: jsonutils.dumps(payload, indent=False))
+    return api_post("eventregistrations", payload, account_id, headers=headers)
 
-def register_contacts_to_event(contact_ids, event_id, reg_type_id, delay=0.5, max_retries=3, account_id=None):
+def _make_pacer(min_interval):
+    """
+    Return a callable that keeps successive calls, from any thread, at least
+    min_interval seconds apart. It sleeps only for the part of the interval
+    that hasn't already passed, so slow requests are not delayed further.
+    """
+    lock = threading.Lock()
+    next_ok = 0.0
+
+    def pace():
+        nonlocal next_ok
+        with lock:
+            now = time.monotonic()
+            slot = max(next_ok, now)
+            next_ok = slot + min_interval
+        if slot > now:
+            time.sleep(slot - now)
+
+    return pace
+
+def _register_one(i, contact_id, event_id, reg_type_id, pace, max_retries, account_id, headers=None):
+    """Register a single contact with retries; returns (contact_id, success)."""
+    success = False
+    for attempt in range(1, max_retries + 1):
+        pace()
+        try:
+            register_contact_to_event(contact_id, event_id, reg_type_id, account_id, headers=headers)
+            logger.debug(f"[{i}] Registered contact {contact_id} (attempt {attempt})")
+            success = True
+            break
+        except ApiHttpError as e:
+            if not e.retryable:
+                # e.g. already registered or an invalid payload; retrying can't help
+                logger.error(f"[{i}] Registration rejected for contact {contact_id}: {e}")
+                return contact_id, False
+            logger.warning(f"[{i}] Attempt {attempt} failed for contact {contact_id}: {e}")
+        except requests.RequestException as e:
+            logger.warning(f"[{i}] Attempt {attempt} failed for contact {contact_id}: {e}")
+        except Exception as e:
+            # e.g. a 2xx body that isn't JSON; fail this contact without retrying so the batch tally survives
+            logger.error(f"[{i}] Registration failed for contact {contact_id}: {e}")
+            return contact_id, False
+
+    if not success:
+        logger.error(f"[{i}] Gave up on contact {contact_id} after {max_retries} attempts.")
+
+    return contact_id, success
+
+def register_contacts_to_event(contact_ids, event_id, reg_type_id, delay=0.5, max_retries=3, account_id=None, max_workers=8):
     if account_id is None:
         account_id = config.account_id
 
@@ -430,25 +550,22 @@ def register_contacts_to_event(contact_ids, event_id, reg_type_id, delay=0.5, ma
     success_ids = []
     failed_ids = []
 
-    for i, contact_id in enumerate(contact_ids, start=1):
-        success = False
-        for attempt in range(1, max_retries + 1):
-            try:
-                register_contact_to_event(contact_id, event_id, reg_type_id, account_id)
-                logger.debug(f"[{i}] Registered contact {contact_id} (attempt {attempt})")
-                success = True
-                break
-            except Exception as e:
-                logger.warning(f"[{i}] Attempt {attempt} failed for contact {contact_id}: {e}")
-                time.sleep(delay)
-
-        if success:
-            success_ids.append(contact_id)
-        else:
-            failed_ids.append(contact_id)
-            logger.error(f"[{i}] Gave up on contact {contact_id} after {max_retries} attempts.")
-
-        time.sleep(delay)
+    # WA has no batch registration endpoint, so the per-contact POSTs share the session across a small pool.
+    # Resolve the token and headers once so the workers neither request nor rebuild them.
+    headers = get_headers(account_id)
+    # delay is the minimum spacing between POSTs (retries included) across all workers
+    pace = _make_pacer(delay)
+    workers = max(1, min(max_workers, len(contact_ids)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(
+            lambda item: _register_one(item[0], item[1], event_id, reg_type_id, pace, max_retries, account_id, headers),
+            enumerate(contact_ids, start=1),
+        )
+        for contact_id, success in results:
+            if success:
+                success_ids.append(contact_id)
+            else:
+                failed_ids.append(contact_id)
 
     logger.info(f"Registration complete: {len(success_ids)} succeeded, {len(failed_ids)} failed.")
     return {"success": success_ids, "failed": failed_ids}
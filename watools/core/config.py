@@ -1,8 +1,8 @@
 import os
 import inspect
 import argparse
+import tomllib
 from pathlib import Path
-from tomlkit import parse
 from loguru import logger
 
 from watools.core import paths  # ⬅️ New import
@@ -31,9 +31,11 @@ class WatoolsConfig:
         return self._cache_dir
 
     def _load_toml_file(self, path: Path):
-        if not path.exists():
-            raise FileNotFoundError(f"Missing TOML file: {path}")
-        return parse(path.read_text())
+        try:
+            with path.open("rb") as f:
+                return tomllib.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Missing TOML file: {path}") from None
 
     def _merge_configs(self, config, credentials):
         accounts = config.get("accounts", {})
@@ -91,7 +93,7 @@ class WatoolsConfig:
         required = ["client_id", "client_secret"]
         optional = []
 
-        logger.trace(f"Account block:\n{account}")
+        logger.trace("Account block:\n{}", account)
 
         missing = [k for k in required if k not in account]
         if missing:
@@ -0,0 +1,47 @@
+"""
+JSON helpers that use orjson when it is installed and the stdlib json module otherwise.
+"""
+
+import json
+
+import click
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data):
+    """Parse a JSON document from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj, indent=True) -> str:
+    """Serialize obj to a JSON string, using a two-space indent unless indent is False."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+def dumpb(obj, indent=True) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, for writing straight to binary files."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def echo(obj, indent=True):
+    """Write obj to stdout as JSON; orjson's bytes go straight to the binary stream."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        click.echo(orjson.dumps(obj, option=option))
+    else:
+        # Stream the encoder's chunks rather than building the whole document as one string
+        stream = click.get_text_stream("stdout")
+        json.dump(obj, stream, indent=2 if indent else None)
+        stream.write("\n")
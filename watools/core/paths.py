@@ -1,8 +1,10 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 
 APP_NAME = "watools"
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Return the root directory of the project (2 levels above this file)."""
     return Path(__file__).resolve().parents[2]
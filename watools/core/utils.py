@@ -2,25 +2,27 @@
 Utility functions for managing AWS accounts.
 """
 
-import os
 import csv
 import ast
-import json
 import click
-import inspect
 
-from typing import Any
+from typing import Any, Callable, Iterable
 from loguru import logger
 from datetime import datetime, timedelta, timezone, date
-from collections import defaultdict, Counter
-
+from functools import lru_cache
+from collections import Counter
 
-import click
+from watools.core import jsonutils
 
 
 def default_contacts_csv_filename():
     return f"contacts-{date.today().isoformat()}.csv"
 
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Memoized datetime.fromisoformat; event dates are parsed when fetched and again when filtered."""
+    return datetime.fromisoformat(value)
+
 def display_kv_table(data: dict, columns: list[str] = None, fill="."):
     # Filter to specified columns if provided
     items = (
@@ -34,9 +36,10 @@ def display_kv_table(data: dict, columns: list[str] = None, fill="."):
         return
 
     max_key_len = max(len(str(k)) for k, _ in items)
-    for k, v in items:
-        padded_key = str(k).ljust(max_key_len, fill)
-        click.echo(f"{padded_key} : {v}")
+    # One write for the whole table instead of one per line
+    click.echo("\n".join(
+        f"{str(k).ljust(max_key_len, fill)} : {v}" for k, v in items
+    ))
 
 
 def display_table(data: list[dict], columns: list[str | dict], max_col_width=40, separator="  "):
@@ -53,10 +56,13 @@ def display_table(data: list[dict], columns: list[str | dict], max_col_width=40,
             key, label = col, col
         normalized_columns.append((key, label))
 
+    # Pull each cell out of its dict once; widths and rows both work from these tuples
+    rows = [tuple(str(row.get(key, "")) for key, _ in normalized_columns) for row in data]
+
     # Compute column widths
     col_widths = []
-    for key, label in normalized_columns:
-        max_data_width = max((len(str(row.get(key, ""))) for row in data), default=0)
+    for i, (key, label) in enumerate(normalized_columns):
+        max_data_width = max((len(cells[i]) for cells in rows), default=0)
         width = min(max(max_data_width, len(label)), max_col_width)
         col_widths.append(width)
 
@@ -64,16 +70,16 @@ def display_table(data: list[dict], columns: list[str | dict], max_col_width=40,
     header = separator.join(
         f"{label:<{col_widths[i]}}" for i, (_, label) in enumerate(normalized_columns)
     )
-    click.echo(header)
-    click.echo("-" * len(header))
+    lines = [header, "-" * len(header)]
 
-    # Print rows
-    for row in data:
+    # Print rows, buffered so the table goes out in one write
+    for cells in rows:
         line = separator.join(
-            f"{str(row.get(key, '')).strip():<{col_widths[i]}}"[:col_widths[i]]
-            for i, (key, _) in enumerate(normalized_columns)
+            f"{cell.strip():<{col_widths[i]}}"[:col_widths[i]]
+            for i, cell in enumerate(cells)
         )
-        click.echo(line)
+        lines.append(line)
+    click.echo("\n".join(lines))
 
 
 class UnsafeExpression(Exception):
@@ -168,11 +174,19 @@ def filter_events(
     use_after = after if after else (None if has_explicit_time_filter else default_after)
     use_before = before if not show_all else None  # Keep before if set, or disable if showing all
 
+    # ISO dates start with the year, so --year is a string prefix test and needs no parsing
+    year_prefix = f"{year}-" if year else None
+
     filtered = []
 
     for event in events:
+        start_date = event.get("StartDate") or ""
+
+        if year_prefix and not start_date.startswith(year_prefix):
+            continue
+
         try:
-            dt = datetime.fromisoformat(event.get("StartDate", ""))
+            dt = parse_iso_datetime(start_date)
         except Exception:
             continue  # Skip events with bad/missing StartDate
 
@@ -183,8 +197,6 @@ def filter_events(
             continue
         if future and dt < now:
             continue
-        if year and dt.year != year:
-            continue
         if month and dt.month != month:
             continue
 
@@ -217,21 +229,6 @@ def list_accounts(accounts):
     display_table( accounts, keys_to_view )
 
 
-def get_event_display_date(event: dict) -> str:
-    """Return StartDate if StartTimeSpecified, otherwise EndDate if EndTimeSpecified."""
-    return_date = None
-    if event.get("StartTimeSpecified"):
-        return_date = event.get("StartDate")
-    elif event.get("EndTimeSpecified"):
-        return_date = event.get("EndDate")
-    if return_date:
-        try:
-            return_date = datetime.fromisoformat(return_date).strftime("%Y-%m-%d %H:%M")
-        except ValueError:
-            logger.error(f"Invalid date format for event ID {event.get('Id')}: {return_date}")
-            return_date = None
-    return return_date
-
 def list_events( events: list|dict,  \
                 columns: list[str|dict] = ["Id",{"wat_start_date":"Date"},{"wat_start_day":"Day"},{"wat_start_time":"Start"},{"wat_confirmed_and_limit":"Conf/Tot"},"Name"], max_col_width=50):
     """List Wild Apricot events by date, name, and ID, or show full event details for a given ID."""
@@ -254,8 +251,8 @@ def list_event_details( event : dict, report_type: str = "summary" ):
             click.echo("No event details provided.")
             return
         
-        logger.trace(f"Event: {json.dumps(event,indent=2)}")
-        logger.trace(f"Keys: {event.keys()}")
+        logger.opt(lazy=True).trace("Event: {}", lambda: jsonutils.dumps(event))
+        logger.trace("Keys: {}", event.keys())
 
         summary_items = ["Id","Name","Location","EventType","StartDate","wat_start_day","EndDate","StartTimeSpecified","EndTimeSpecified",
                          'PendingRegistrationsCount', 'ConfirmedRegistrationsCount','WaitListRegistrationCount', 'CheckedInAttendeesNumber',
@@ -281,17 +278,16 @@ def list_groups( group_list: dict ):
             click.echo("No groups found.")
             return
         
-        logger.trace(f"Group list: {group_list}")
+        logger.opt(lazy=True).trace("Group list: {}", lambda: jsonutils.dumps(group_list, indent=False))
 
         groups = group_list.get("MemberGroups", [])
 
-        for g in groups:
+        # Build the listing first and write it once
+        if groups:
+            click.echo("\n".join(
+                f"{g.get('Id', 'Unknown ID')} | {g.get('Name', 'Unnamed Event')}" for g in groups
+            ))
 
-            name = g.get("Name", "Unnamed Event")
-            eid = g.get("Id", "Unknown ID")
-
-            click.echo(f"{eid} | {name}")
-            
     except Exception as e:
         click.echo(f"Error: {e}")
 
@@ -302,17 +298,16 @@ def list_group_details( group_list: dict, **kwargs ):
             click.echo("No groups found.")
             return
         
-        logger.trace(f"Group list: {group_list}")
+        logger.opt(lazy=True).trace("Group list: {}", lambda: jsonutils.dumps(group_list, indent=False))
 
         groups = group_list.get("MemberGroups", [])
 
-        for g in groups:
-
-            name = g.get("Name", "Unnamed Event")
-            eid = g.get("Id", "Unknown ID")
+        # Build the listing first and write it once
+        if groups:
+            click.echo("\n".join(
+                f"{g.get('Id', 'Unknown ID')} | {g.get('Name', 'Unnamed Event')}" for g in groups
+            ))
 
-            click.echo(f"{eid} | {name}")
-            
     except Exception as e:
         click.echo(f"Error: {e}")
 
@@ -324,17 +319,16 @@ def list_contacts( contact_list: dict ):
             click.echo("No groups found.")
             return
         
-        logger.trace(f"Contact list: {contact_list}")
+        logger.opt(lazy=True).trace("Contact list: {}", lambda: jsonutils.dumps(contact_list, indent=False))
 
         contacts = contact_list.get("Contacts", [])
 
-        for contact in contacts:
+        # Build the listing first and write it once
+        if contacts:
+            click.echo("\n".join(
+                f"{c.get('Id', 'Unknown ID')} | {c.get('Name', 'Unnamed Event')}" for c in contacts
+            ))
 
-            name = contact.get("Name", "Unnamed Event")
-            eid = contact.get("Id", "Unknown ID")
-
-            click.echo(f"{eid} | {name}")
-            
     except Exception as e:
         click.echo(f"Error: {e}")
 
@@ -345,44 +339,46 @@ def list_contact_details( contact_list: dict ):
             click.echo("No groups found.")
             return
         
-        logger.trace(f"Contact list: {contact_list}")
+        logger.opt(lazy=True).trace("Contact list: {}", lambda: jsonutils.dumps(contact_list, indent=False))
 
         contacts = contact_list.get("Contacts", [])
 
-        for contact in contacts:
-
-            name = contact.get("Name", "Unnamed person")
-            eid = contact.get("Id", "Unknown ID")
+        # Build the listing first and write it once
+        if contacts:
+            click.echo("\n".join(
+                f"{c.get('Id', 'Unknown ID')} | {c.get('Name', 'Unnamed person')}" for c in contacts
+            ))
 
-            click.echo(f"{eid} | {name}")
-            
     except Exception as e:
         click.echo(f"Error: {e}")
 
 
-def summarize_contact_fields(contacts: list) -> list:
+def summarize_contact_fields(contacts: Iterable[dict]) -> list:
     """
     Analyzes the contact list and returns a sorted list of all unique field names.
     Verifies that all contacts contain the same fields.
 
     Parameters:
-    - contacts: List of contact dictionaries
+    - contacts: Iterable of contact dictionaries (a list or a generator)
 
     Returns:
     - List of field names (keys)
     """
-    if not contacts:
+    it = iter(contacts)
+    first = next(it, None)
+    if first is None:
         click.echo("No contacts provided.")
         return []
 
     # Start with the keys from the first contact
-    base_keys = set(contacts[0].keys())
+    base_keys = set(first.keys())
     consistent = True
 
-    for idx, contact in enumerate(contacts[1:], start=2):
-        keys = set(contact.keys())
-        if keys != base_keys:
+    for idx, contact in enumerate(it, start=2):
+        # dict_keys compares against a set directly; only build a set when they differ
+        if contact.keys() != base_keys:
             consistent = False
+            keys = set(contact)
             extra = keys - base_keys
             missing = base_keys - keys
             click.echo(f"Inconsistent fields at contact #{idx}:")
@@ -417,26 +413,18 @@ def normalize_contacts(contacts: list) -> list:
     for contact in contacts:
         all_keys.update(contact.keys())
 
+    # Copy an all-None template and overlay each contact, so missing keys stay None
+    template = dict.fromkeys(all_keys)
     normalized = []
     for contact in contacts:
-        # Fill in missing keys with None
-        normalized_contact = {key: contact.get(key, None) for key in all_keys}
+        normalized_contact = template.copy()
+        normalized_contact.update(contact)
         normalized.append(normalized_contact)
 
     click.secho(f"Normalized all contacts to {len(all_keys)} fields.", fg="blue")
     return normalized
 
 
-def write_contacts_to_csvxx( contacts, filename ):
-    """ Write contacts to CSV file """
-
-    click.echo(f"writing CSV to: {filename}, records: {len(contacts)}")
-
-    contacts = normalize_contacts( contacts )
-    click.echo( json.dumps( contacts, indent=2) )
-
-    return
-
 def extract_value(value):
     if isinstance(value, dict):
         return value.get("Label") or value.get("Value") or str(value)
@@ -454,9 +442,14 @@ def write_contacts_to_csv(contacts, filename):
     flattened_rows = []
     column_values = {}  # Track all values per column
 
+    # Top-level keys across every contact, so a FieldValue whose SystemCode clashes with
+    # one is renamed the same way on every row, even where that contact lacks the key
+    top_level_keys = set()
+    for contact in contacts:
+        top_level_keys.update(contact.keys())
+
     for contact in contacts:
         flat_row = {}
-        top_level_keys = set(contact.keys())
 
         for key, value in contact.items():
             if key == "FieldValues":
@@ -513,11 +506,7 @@ def write_contacts_to_csv(contacts, filename):
     print(f"Wrote {len(flattened_rows)} contacts to {filename}")
     
 
-
-from collections import Counter
-import click
-
-def summarize_membership_levels(contacts: list):
+def summarize_membership_levels(contacts: Iterable[dict]):
     """
     Print a summary table of membership levels from an unnormalized contact list.
 
@@ -557,11 +546,7 @@ def summarize_membership_levels(contacts: list):
     click.echo("-" * 50)
     click.secho(f"{'Total Contacts':<10} {sum(counter.values()):>5}", fg="green")
 
-
-from collections import defaultdict, Counter
-import click
-
-def summarize_member_groups(contacts: list):
+def summarize_member_groups(contacts: Iterable[dict]):
     """
     Summarize group participation using 'FieldValues' with FieldName == 'Group participation'.
 
@@ -574,16 +559,16 @@ def summarize_member_groups(contacts: list):
     group_names = {}
 
     for contact in contacts:
-        field_values = contact.get("FieldValues", [])
-        for field in field_values:
-            if field.get("FieldName") == "Group participation":
-                groups = field.get("Value", [])
-                for group in groups:
-                    group_id = group.get("Id")
-                    group_label = group.get("Label", "Unknown Group")
-                    if group_id:
-                        group_counts[group_id] += 1
-                        group_names[group_id] = group_label
+        # Only the one group field matters, so stop scanning FieldValues once it is found
+        field = next((f for f in contact.get("FieldValues", []) if f.get("FieldName") == "Group participation"), None)
+        if field is None:
+            continue
+        for group in field.get("Value", []):
+            group_id = group.get("Id")
+            group_label = group.get("Label", "Unknown Group")
+            if group_id:
+                group_counts[group_id] += 1
+                group_names[group_id] = group_label
 
     if not group_counts:
         click.secho("No group participation data found in FieldValues.", fg="yellow")
@@ -602,214 +587,159 @@ def summarize_member_groups(contacts: list):
 
 
 
-def summarize_levels_by_status(contacts: list):
-    """
-    Print a table summarizing membership levels by status.
+# Short status labels and column order shared by the *_by_status summaries
+_STATUS_ALIAS = {"PendingNew": "P.New", "PendingRenewal": "P.Renew"}
+_PREFERRED_STATUS_ORDER = ("Active", "P.Renew", "P.New", "Lapsed", "Unknown")
+# Raw or short status -> (short label, column position), so each contact costs one lookup
+_STATUS_LOOKUP = {status: (status, i) for i, status in enumerate(_PREFERRED_STATUS_ORDER)}
+_STATUS_LOOKUP.update({raw: _STATUS_LOOKUP[alias] for raw, alias in _STATUS_ALIAS.items()})
+# Row names that sort after all the others
+_SORT_LAST_NAMES = frozenset({"Friend", "Non-Member"})
 
-    Columns:
-    - Level ID (left-aligned)
-    - Membership status counts (right-aligned, using short labels)
-    - Row total (right-aligned)
-    - Level Name (left-aligned, max 30 chars)
-    """
-    summary = defaultdict(Counter)
-    level_names = {}
-    all_statuses = set()
 
-    # Prepare data
-    for contact in contacts:
-        level = contact.get("MembershipLevel")
-        if isinstance(level, dict):
-            level_id = level.get("Id")
-            level_name = level.get("Name", "Unknown Level")
-        else:
-            level_id = None
-            level_name = "Non-Member"
+def _name_sort_key(name: str) -> tuple:
+    return (name in _SORT_LAST_NAMES, name.lower())
 
-        raw_status = str(contact.get("Status") or "Unknown")
-        status = {
-            "PendingNew": "P.New",
-            "PendingRenewal": "P.Renew"
-        }.get(raw_status, raw_status)
 
-        summary[level_id][status] += 1
-        level_names[level_id] = level_name
-        all_statuses.add(status)
+_SUMMARY_COL_WIDTHS = {
+    "id": 10,
+    "status": 8,
+    "row_total": 8,
+    "name": 30
+}
 
-    # Column settings
 
-    preferred_order = ["Active", "P.Renew", "P.New", "Lapsed", "Unknown"]
-    # Only include statuses that actually exist in your data
-    status_columns = [status for status in preferred_order if status in all_statuses]
-    
-    #level_ids = sorted(summary.keys(), key=lambda x: (x is None, x or 0))
+@lru_cache(maxsize=16)
+def _summary_layout(status_columns: tuple[str, ...], dim_label: str) -> tuple[str, str, str]:
+    """Return (row format, header, separator) for a by-status table with the given columns."""
+    col_widths = _SUMMARY_COL_WIDTHS
 
-    level_ids = sorted(
-        summary.keys(),
-        key=lambda x: (
-            level_names.get(x, "Non-Member") in {"Friend", "Non-Member"},  # True → sort last
-            level_names.get(x, "Non-Member").lower()
-        )
+    separator = "-" * (
+        col_widths['id'] + 1 +
+        len(status_columns) * (col_widths['status'] + 1) +
+        col_widths['row_total'] + 1 +
+        col_widths['name']
     )
 
-    col_widths = {
-        "level_id": 10,
-        "status": 8,
-        "row_total": 8,
-        "level_name": 30
-    }
+    # Header, rows and footer share one format string
+    row_fmt = (
+        f"{{:<{col_widths['id']}}} " +
+        f"{{:>{col_widths['status']}}} " * len(status_columns) +
+        f"{{:>{col_widths['row_total']}}} {{:<{col_widths['name']}}}"
+    )
 
-    # Print header
-    click.secho("\nMembership Level Summary by Status", bold=True, fg="cyan")
-    header = f"{'Level ID':<{col_widths['level_id']}} " + \
-             " ".join(f"{status:>{col_widths['status']}}" for status in status_columns) + " " + \
-             f"{'Total':>{col_widths['row_total']}} " + \
-             f"{'Level Name':<{col_widths['level_name']}}"
-    click.echo(header)
-    click.echo("-" * (
-        col_widths['level_id'] + 1 +
-        len(status_columns) * (col_widths['status'] + 1) +
-        col_widths['row_total'] + 1 +
-        col_widths['level_name']
-    ))
+    header = row_fmt.format(f"{dim_label} ID", *status_columns, "Total", f"{dim_label} Name")
+    return row_fmt, header, separator
+
+
+def _level_keys(contact: dict) -> list[tuple]:
+    """(Id, Name) of the contact's membership level; contacts without one count as Non-Member."""
+    level = contact.get("MembershipLevel")
+    if isinstance(level, dict):
+        return [(level.get("Id"), level.get("Name", "Unknown Level"))]
+    return [(None, "Non-Member")]
+
+
+def _group_keys(contact: dict) -> list[tuple]:
+    """(Id, Label) of each group in the contact's Groups field."""
+    # Only the one group field matters, so stop scanning FieldValues once it is found
+    field = next((f for f in contact.get("FieldValues", []) if f.get("SystemCode") == "Groups"), None)
+    if field is None or not isinstance(field.get("Value"), list):
+        return []
+    return [(group.get("Id"), group.get("Label", "Unknown Group")) for group in field["Value"]]
+
+
+def _summarize_by_status(contacts: Iterable[dict], extract_keys: Callable[[dict], list[tuple]],
+                         title: str, dim_label: str,
+                         status_filter: set[str] | None = None):
+    """
+    Print a table of contact counts by status, one row per (Id, Name) pair that
+    extract_keys(contact) returns; shared by the level and group summaries.
+    """
+    # One list of counts per row, indexed by position in _PREFERRED_STATUS_ORDER;
+    # statuses outside that order are not shown, so they are not counted
+    summary = {}
+    names = {}
+    col_totals = [0] * len(_PREFERRED_STATUS_ORDER)
+
+    for contact in contacts:
+        raw_status = str(contact.get("Status") or "Unknown")
+        status, idx = _STATUS_LOOKUP.get(raw_status, (raw_status, None))
+        if status_filter is not None and status not in status_filter:
+            continue
+
+        for key_id, name in extract_keys(contact):
+            counts = summary.get(key_id)
+            if counts is None:
+                counts = summary[key_id] = [0] * len(_PREFERRED_STATUS_ORDER)
+            names[key_id] = name
+            if idx is not None:
+                counts[idx] += 1
+                col_totals[idx] += 1
+
+    # Only include statuses that actually exist in your data
+    column_idx = [i for i, total in enumerate(col_totals) if total]
+    status_columns = [_PREFERRED_STATUS_ORDER[i] for i in column_idx]
+
+    row_ids = sorted(summary, key=lambda x: _name_sort_key(names[x]))
+
+    # Print header; the table is collected in lines and written with a single echo
+    row_fmt, header, separator = _summary_layout(tuple(status_columns), dim_label)
+    lines = [click.style(f"\n{title}", bold=True, fg="cyan"), header, separator]
 
     # Print rows
-    total_counts = Counter()
-    for level_id in level_ids:
-        row = f"{str(level_id or 'None'):<{col_widths['level_id']}} "
-        row_total = 0
-        for status in status_columns:
-            count = summary[level_id].get(status, 0)
-            row += f"{count:>{col_widths['status']}} "
-            total_counts[status] += count
-            row_total += count
-        row += f"{row_total:>{col_widths['row_total']}} "
-        level_name = level_names.get(level_id, "Unknown")[:col_widths['level_name']]
-        row += f"{level_name:<{col_widths['level_name']}}"
-        click.echo(row)
+    for row_id in row_ids:
+        counts = summary[row_id]
+        lines.append(row_fmt.format(
+            str(row_id or 'None'), *(counts[i] for i in column_idx), sum(counts),
+            names[row_id][:_SUMMARY_COL_WIDTHS['name']]
+        ))
 
     # Footer total row
-    footer = f"{'Total':<{col_widths['level_id']}} "
-    grand_total = 0
-    for status in status_columns:
-        count = total_counts[status]
-        footer += f"{count:>{col_widths['status']}} "
-        grand_total += count
-    footer += f"{grand_total:>{col_widths['row_total']}} "
-    footer += " " * col_widths['level_name']
-
-    click.echo("-" * (
-        col_widths['level_id'] + 1 +
-        len(status_columns) * (col_widths['status'] + 1) +
-        col_widths['row_total'] + 1 +
-        col_widths['level_name']
-    ))
-    click.secho(footer, fg="green")
+    footer = row_fmt.format("Total", *(col_totals[i] for i in column_idx), sum(col_totals), "")
+
+    lines.append(separator)
+    lines.append(click.style(footer, fg="green"))
+    click.echo("\n".join(lines))
 
 
-def summarize_groups_by_status(contacts: list):
+def summarize_levels_by_status(contacts: Iterable[dict], status_filter: set[str] | None = None):
     """
-    Print a table summarizing group participation by membership status.
+    Print a table summarizing membership levels by status.
+
+    If status_filter is given, only contacts whose short status label is in it are counted.
 
     Columns:
-    - Group ID (left-aligned)
+    - Level ID (left-aligned)
     - Membership status counts (right-aligned, using short labels)
     - Row total (right-aligned)
-    - Group Name (left-aligned, max 30 chars)
+    - Level Name (left-aligned, max 30 chars)
     """
-    summary = defaultdict(Counter)
-    group_names = {}
-    all_statuses = set()
+    _summarize_by_status(contacts, _level_keys, "Membership Level Summary by Status", "Level", status_filter)
 
-    for contact in contacts:
-        status_raw = str(contact.get("Status") or "Unknown")
-        status = {
-            "PendingNew": "P.New",
-            "PendingRenewal": "P.Renew"
-        }.get(status_raw, status_raw)
-
-        field_values = contact.get("FieldValues", [])
-        for field in field_values:
-            if field.get("SystemCode") == "Groups" and isinstance(field.get("Value"), list):
-                for group in field["Value"]:
-                    group_id = group.get("Id")
-                    group_name = group.get("Label", "Unknown Group")
-                    summary[group_id][status] += 1
-                    group_names[group_id] = group_name
-                    all_statuses.add(status)
-
-    # Preferred column order
-    preferred_order = ["Active", "P.Renew", "P.New", "Lapsed", "Unknown"]
-    status_columns = [status for status in preferred_order if status in all_statuses]
-
-    group_ids = sorted(
-        summary.keys(),
-        key=lambda x: (
-            group_names.get(x, "Unknown Group") in {"Friend", "Non-Member"},  # sort last if needed
-            group_names.get(x, "Unknown Group").lower()
-        )
-    )
 
-    col_widths = {
-        "group_id": 10,
-        "status": 8,
-        "row_total": 8,
-        "group_name": 30
-    }
+def summarize_groups_by_status(contacts: Iterable[dict], status_filter: set[str] | None = None):
+    """
+    Print a table summarizing group participation by membership status.
 
-    # Print header
-    click.secho("\nGroup Participation Summary by Status", bold=True, fg="cyan")
-    header = f"{'Group ID':<{col_widths['group_id']}} " + \
-             " ".join(f"{status:>{col_widths['status']}}" for status in status_columns) + " " + \
-             f"{'Total':>{col_widths['row_total']}} " + \
-             f"{'Group Name':<{col_widths['group_name']}}"
-    click.echo(header)
-    click.echo("-" * (
-        col_widths['group_id'] + 1 +
-        len(status_columns) * (col_widths['status'] + 1) +
-        col_widths['row_total'] + 1 +
-        col_widths['group_name']
-    ))
+    If status_filter is given, only contacts whose short status label is in it are counted.
 
-    # Print rows
-    total_counts = Counter()
-    for group_id in group_ids:
-        row = f"{str(group_id or 'None'):<{col_widths['group_id']}} "
-        row_total = 0
-        for status in status_columns:
-            count = summary[group_id].get(status, 0)
-            row += f"{count:>{col_widths['status']}} "
-            total_counts[status] += count
-            row_total += count
-        row += f"{row_total:>{col_widths['row_total']}} "
-        group_name = group_names.get(group_id, "Unknown Group")[:col_widths['group_name']]
-        row += f"{group_name:<{col_widths['group_name']}}"
-        click.echo(row)
-
-    # Footer row
-    footer = f"{'Total':<{col_widths['group_id']}} "
-    grand_total = 0
-    for status in status_columns:
-        count = total_counts[status]
-        footer += f"{count:>{col_widths['status']}} "
-        grand_total += count
-    footer += f"{grand_total:>{col_widths['row_total']}} "
-    footer += " " * col_widths['group_name']
-
-    click.echo("-" * (
-        col_widths['group_id'] + 1 +
-        len(status_columns) * (col_widths['status'] + 1) +
-        col_widths['row_total'] + 1 +
-        col_widths['group_name']
-    ))
-    click.secho(footer, fg="green")
+    Columns:
+    - Group ID (left-aligned)
+    - Membership status counts (right-aligned, using short labels)
+    - Row total (right-aligned)
+    - Group Name (left-aligned, max 30 chars)
+    """
+    _summarize_by_status(contacts, _group_keys, "Group Participation Summary by Status", "Group", status_filter)
 
 def member_legend():
     # Explanation
 
-    click.echo("")
-    click.echo("Active     : Members whose status is Active and membership is current.")
-    click.echo("P.Renew    : Members whose renewal is overdue but still within the grace period (PendingRenewal).")
-    click.echo("P.New      : Members who have applied and are awaiting approval (PendingNew).")
-    click.echo("Lapsed     : Members whose membership has expired and are outside the grace period.")
-    click.echo("Unknown    : Contacts with no recognized status or missing status field.")
+    click.echo("\n".join([
+        "",
+        "Active     : Members whose status is Active and membership is current.",
+        "P.Renew    : Members whose renewal is overdue but still within the grace period (PendingRenewal).",
+        "P.New      : Members who have applied and are awaiting approval (PendingNew).",
+        "Lapsed     : Members whose membership has expired and are outside the grace period.",
+        "Unknown    : Contacts with no recognized status or missing status field.",
+    ]))